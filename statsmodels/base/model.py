@@ -4,7 +4,7 @@ from functools import reduce
 import warnings
 
 import numpy as np
-from scipy import stats
+from scipy import special, stats
 from statsmodels.base.data import handle_data
 from statsmodels.tools.data import _is_using_pandas
 from statsmodels.tools.tools import recipr, nan_dot
@@ -1372,13 +1372,15 @@ class LikelihoodModelResults(Results):
     @cached_value
     def pvalues(self):
         """The two-tailed p values for the t-stats of the params."""
+        # use the special functions directly, these are what stats.t.sf and
+        # stats.norm.sf evaluate without the generic distribution overhead
         with warnings.catch_warnings():
             warnings.simplefilter("ignore", RuntimeWarning)
             if self.use_t:
                 df_resid = getattr(self, 'df_resid_inference', self.df_resid)
-                return stats.t.sf(np.abs(self.tvalues), df_resid) * 2
+                return special.stdtr(df_resid, -np.abs(self.tvalues)) * 2
             else:
-                return stats.norm.sf(np.abs(self.tvalues)) * 2
+                return special.ndtr(-np.abs(self.tvalues)) * 2
 
     def cov_params(self, r_matrix=None, column=None, scale=None, cov_p=None,
                    other=None):
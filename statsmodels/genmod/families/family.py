@@ -863,7 +863,7 @@ class Binomial(Family):
             y = endog[:, 0]
             # overwrite self.freq_weights for deviance below
             self.n = endog.sum(1)
-            return y*1./self.n, self.n
+            return np.true_divide(y, self.n), self.n
         else:
             return endog, np.ones(endog.shape[0])
 
@@ -794,8 +794,10 @@ class GLM(base.LikelihoodModel):
                              (self.scaletype, type(self.scaletype)))
 
     def _estimate_x2_scale(self, mu):
-        resid = np.power(self.endog - mu, 2) * self.iweights
-        return np.sum(resid / self.family.variance(mu)) / self.df_resid
+        resid = self.endog - mu
+        wresid = resid * self.iweights
+        wresid /= self.family.variance(mu)
+        return np.dot(resid, wresid) / self.df_resid
 
     def estimate_tweedie_power(self, mu, method='brentq', low=1.01, high=5.):
         """
@@ -953,12 +955,13 @@ class GLM(base.LikelihoodModel):
         # this checks what kind of data is given for Binomial.
         # family will need a reference to endog if this is to be removed from
         # preprocessing
-        self.n_trials = np.ones((self.endog.shape[0]))  # For binomial
         if isinstance(self.family, families.Binomial):
             tmp = self.family.initialize(self.endog, self.freq_weights)
             self.endog = tmp[0]
             self.n_trials = tmp[1]
             self._init_keys.append('n_trials')
+        else:
+            self.n_trials = np.ones((self.endog.shape[0]))
 
     def fit(self, start_params=None, maxiter=100, method='IRLS', tol=1e-8,
             scale=None, cov_type='nonrobust', cov_kwds=None, use_t=None,
@@ -1019,14 +1022,26 @@ class GLM(base.LikelihoodModel):
             (available with IRLS fits) Defaults to ``'deviance'``. Can
             optionally be ``'params'``.
         wls_method : str, optional
-            (available with IRLS fits) options are 'lstsq', 'pinv' and 'qr'
-            specifies which linear algebra function to use for the irls
-            optimization. Default is `lstsq` which uses the same underlying
-            svd based approach as 'pinv', but is faster during iterations.
-            'lstsq' and 'pinv' regularize the estimate in singular and
-            near-singular cases by truncating small singular values based
-            on `rcond` of the respective numpy.linalg function. 'qr' is
-            only valid for cases that are not singular nor near-singular.
+            (available with IRLS fits) options are 'lstsq', 'pinv', 'qr' and
+            'cholesky' specifies which linear algebra function to use for the
+            irls optimization. Default is `lstsq` which uses the LAPACK
+            solver gelsy, a QR factorization with column pivoting, and is
+            faster during iterations than 'pinv'. Both return the minimum
+            norm solution in singular and near-singular cases. 'lstsq'
+            truncates the rank where the condition number estimate of the
+            triangular factor exceeds 1 / (eps * max(nobs, k_vars)), 'pinv'
+            truncates small singular values based on `rcond` of
+            numpy.linalg.pinv.
+            The final covariance is always computed with 'pinv', or with
+            'qr' if that is the chosen method.
+            'qr' is only valid for cases that are not singular nor
+            near-singular. 'cholesky' solves the normal equations of the
+            weighted least squares problem and is the fastest option, but it
+            is only valid for well-conditioned cases.
+        max_step_halving : int, optional
+            (available with IRLS fits) The maximum number of times that the
+            step of an IRLS iteration is halved if the deviance is not
+            finite. Defaults to 10. Set to 0 to disable step halving.
         optim_hessian : {'eim', 'oim'}, optional
             (available with scipy optimizer fits) When 'oim'--the default--the
             observed Hessian is used in fitting. 'eim' is the expected Hessian.
@@ -1161,17 +1176,24 @@ class GLM(base.LikelihoodModel):
         rtol = kwargs.get('rtol', 0.)
         tol_criterion = kwargs.get('tol_criterion', 'deviance')
         wls_method = kwargs.get('wls_method', 'lstsq')
+        max_step_halving = kwargs.get('max_step_halving', 10)
         atol = tol if atol is None else atol
 
         endog = self.endog
         wlsexog = self.exog
+        # plain array so that in-place updates of the buffers below work
+        offset_exposure = np.asarray(self._offset_exposure)
         if start_params is None:
             start_params = np.zeros(self.exog.shape[1])
             mu = self.family.starting_mu(self.endog)
             lin_pred = self.family.predict(mu)
+            # the starting mu does not correspond to any params, so the
+            # first step cannot be halved
+            params_prev = None
         else:
-            lin_pred = np.dot(wlsexog, start_params) + self._offset_exposure
+            lin_pred = np.dot(wlsexog, start_params) + offset_exposure
             mu = self.family.fitted(lin_pred)
+            params_prev = start_params
         self.scale = self.estimate_scale(mu)
         dev = self.family.deviance(self.endog, mu, self.var_weights,
                                    self.freq_weights, self.scale)
@@ -1185,6 +1207,7 @@ class GLM(base.LikelihoodModel):
         history = dict(params=[np.inf, start_params], deviance=[np.inf, dev])
         converged = False
         criterion = history[tol_criterion]
+        dev_prev = dev
         # This special case is used to get the likelihood for a specific
         # params vector.
         if maxiter == 0:
@@ -1192,35 +1215,92 @@ class GLM(base.LikelihoodModel):
             self.scale = self.estimate_scale(mu)
             wls_results = lm.RegressionResults(self, start_params, None)
             iteration = 0
+        # buffers for the weighted exog, the working response and the
+        # linear predictor, reused in all WLS iterations
+        wexog_buf = np.empty_like(wlsexog, dtype=float)
+        wlsendog = np.empty(wlsexog.shape[0])
+        lin_pred_buf = np.empty(wlsexog.shape[0],
+                                dtype=np.result_type(wlsexog, np.float64))
+        # data weights do not change across iterations, the multiplication
+        # is skipped if they are all one
+        data_weights = self.iweights * self.n_trials
+        if np.all(data_weights == 1):
+            data_weights = None
+        n_halving = 0
         for iteration in range(maxiter):
-            self.weights = (self.iweights * self.n_trials *
-                            self.family.weights(mu))
-            wlsendog = (lin_pred + self.family.link.deriv(mu) * (self.endog-mu)
-                        - self._offset_exposure)
+            self.weights = self.family.weights(mu)
+            if data_weights is not None:
+                self.weights *= data_weights
+            np.subtract(self.endog, mu, out=wlsendog)
+            wlsendog *= self.family.link.deriv(mu)
+            wlsendog += lin_pred
+            wlsendog -= offset_exposure
             wls_mod = reg_tools._MinimalWLS(wlsendog, wlsexog,
                                             self.weights, check_endog=True,
-                                            check_weights=True)
+                                            check_weights=True,
+                                            out=wexog_buf)
             wls_results = wls_mod.fit(method=wls_method)
-            lin_pred = np.dot(self.exog, wls_results.params)
-            lin_pred += self._offset_exposure
-            mu = self.family.fitted(lin_pred)
-            history = self._update_history(wls_results, mu, history)
-            self.scale = self.estimate_scale(mu)
+            params = wls_results.params
+            n_halving = 0
+            while True:
+                lin_pred = np.dot(self.exog, params, out=lin_pred_buf)
+                lin_pred += offset_exposure
+                mu = self.family.fitted(lin_pred)
+                # the unscaled deviance is shared by the history and the
+                # deviance based scale estimate
+                dev = self.family.deviance(self.endog, mu, self.var_weights,
+                                           self.freq_weights, 1.)
+                if (np.isfinite(dev) or params_prev is None or
+                        n_halving >= max_step_halving):
+                    break
+                # step halving if the deviance is not finite
+                params = (params + params_prev) / 2.
+                n_halving += 1
+            params_prev = params
+            dev_scaled = dev / self.scale
+            history['params'].append(params)
+            history['deviance'].append(dev_scaled)
+            if self.scaletype == 'dev':
+                self.scale = dev / self.df_resid
+            else:
+                self.scale = self.estimate_scale(mu)
             if endog.squeeze().ndim == 1 and np.allclose(mu - endog, 0):
                 msg = "Perfect separation detected, results not available"
                 raise PerfectSeparationError(msg)
-            converged = _check_convergence(criterion, iteration + 1, atol,
-                                           rtol)
+            if tol_criterion == 'deviance':
+                # scalar version of _check_convergence on the last two
+                # deviances, avoids indexing the history in each iteration
+                converged = (dev_scaled == dev_prev or
+                             abs(dev_scaled - dev_prev) <=
+                             atol + rtol * abs(dev_scaled))
+                dev_prev = dev_scaled
+            else:
+                converged = _check_convergence(criterion, iteration + 1,
+                                               atol, rtol)
             if converged:
                 break
         self.mu = mu
 
         if maxiter > 0:  # Only if iterative used
-            wls_method2 = 'pinv' if wls_method == 'lstsq' else wls_method
+            if n_halving > 0:
+                # the final WLS fit uses the weights at the accepted, halved
+                # step so that the covariance matches params and mu
+                self.weights = self.family.weights(mu)
+                if data_weights is not None:
+                    self.weights *= data_weights
+                np.subtract(self.endog, mu, out=wlsendog)
+                wlsendog *= self.family.link.deriv(mu)
+                wlsendog += lin_pred
+                wlsendog -= offset_exposure
+            wls_method2 = 'qr' if wls_method == 'qr' else 'pinv'
             wls_model = lm.WLS(wlsendog, wlsexog, self.weights)
             wls_results = wls_model.fit(method=wls_method2)
+            if n_halving == 0:
+                params = wls_results.params
+        else:
+            params = wls_results.params
 
-        glm_results = GLMResults(self, wls_results.params,
+        glm_results = GLMResults(self, params,
                                  wls_results.normalized_cov_params,
                                  self.scale,
                                  cov_type=cov_type, cov_kwds=cov_kwds,
@@ -1523,7 +1603,7 @@ class GLMResults(base.LikelihoodModelResults):
         Response residuals.  The response residuals are defined as
         `endog` - `fittedvalues`
         """
-        return self._n_trials * (self._endog-self.mu)
+        return self._n_trials * self._resid_raw
 
     @cached_data
     def resid_pearson(self):
@@ -1533,9 +1613,9 @@ class GLMResults(base.LikelihoodModelResults):
         specific variance function.  See statsmodels.families.family and
         statsmodels.families.varfuncs for more information.
         """
-        return (np.sqrt(self._n_trials) * (self._endog-self.mu) *
+        return (np.sqrt(self._n_trials) * self._resid_raw *
                 np.sqrt(self._var_weights) /
-                np.sqrt(self.family.variance(self.mu)))
+                np.sqrt(self._variance_mu))
 
     @cached_data
     def resid_working(self):
@@ -1600,7 +1680,8 @@ class GLMResults(base.LikelihoodModelResults):
         Pearson's Chi-Squared statistic is defined as the sum of the squares
         of the Pearson residuals.
         """
-        chisq = (self._endog - self.mu)**2 / self.family.variance(self.mu)
+        chisq = self._resid_raw * self._resid_raw
+        chisq /= self._variance_mu
         chisq *= self._iweights * self._n_trials
         chisqsum = np.sum(chisq)
         return chisqsum
@@ -1624,6 +1705,20 @@ class GLMResults(base.LikelihoodModelResults):
         """
         return self.model.predict(self.params)
 
+    @cached_data
+    def _resid_raw(self):
+        """
+        Unweighted difference `endog` - `mu` shared by the residuals.
+        """
+        return self._endog - self.mu
+
+    @cached_data
+    def _variance_mu(self):
+        """
+        Variance function of the family evaluated at `mu`.
+        """
+        return self.family.variance(self.mu)
+
     @cache_readonly
     def null(self):
         """
@@ -1631,18 +1726,19 @@ class GLMResults(base.LikelihoodModelResults):
         """
         endog = self._endog
         model = self.model
-        exog = np.ones((len(endog), 1))
-
-        kwargs = model._get_init_kwds()
-        kwargs.pop('family')
-        if hasattr(self.model, '_offset_exposure'):
+        offset_exposure = getattr(model, '_offset_exposure', 0.)
+        if (offset_exposure is None or
+                not (np.isscalar(offset_exposure) and offset_exposure == 0.)):
+            exog = np.ones((len(endog), 1))
+            kwargs = model._get_init_kwds()
+            kwargs.pop('family')
             return GLM(endog, exog, family=self.family,
                        **kwargs).fit().fittedvalues
         else:
-            # correct if fitted is identical across observations
-            wls_model = lm.WLS(endog, exog,
-                               weights=self._iweights * self._n_trials)
-            return wls_model.fit().fittedvalues
+            # without offset the fitted values of the null model are
+            # identical across observations and equal to the weighted mean
+            weights = self._iweights * self._n_trials
+            return np.full(len(endog), np.average(endog, weights=weights))
 
     @cache_readonly
     def deviance(self):
@@ -1686,7 +1782,8 @@ class GLMResults(base.LikelihoodModelResults):
                 # Scale for the concentrated Gaussian log likelihood
                 # (profile log likelihood with the scale parameter
                 # profiled out).
-                scale = (np.power(self._endog - self.mu, 2) * self._iweights).sum()
+                resid = self._resid_raw
+                scale = np.dot(resid * self._iweights, resid)
                 scale /= self.model.wnobs
             else:
                 scale = self.scale
@@ -1331,24 +1331,96 @@ def test_glm_irls_method():
     res1 = mod.fit()
     res2 = mod.fit(wls_method='pinv', attach_wls=True)
     res3 = mod.fit(wls_method='qr', attach_wls=True)
+    res4 = mod.fit(wls_method='cholesky', attach_wls=True)
     # fit_gradient does not attach mle_settings
     res_g1 = mod.fit(start_params=res1.params, method='bfgs')
 
-    for r in [res1, res2, res3]:
+    for r in [res1, res2, res3, res4]:
         assert_equal(r.mle_settings['optimizer'], 'IRLS')
         assert_equal(r.method, 'IRLS')
 
     assert_equal(res1.mle_settings['wls_method'], 'lstsq')
     assert_equal(res2.mle_settings['wls_method'], 'pinv')
     assert_equal(res3.mle_settings['wls_method'], 'qr')
+    assert_equal(res4.mle_settings['wls_method'], 'cholesky')
 
     assert_(hasattr(res2.results_wls.model, 'pinv_wexog'))
     assert_(hasattr(res3.results_wls.model, 'exog_Q'))
+    assert_(hasattr(res4.results_wls.model, 'pinv_wexog'))
+
+    assert_allclose(res4.params, res1.params, rtol=1e-10)
+    assert_allclose(res4.bse, res1.bse, rtol=1e-10)
 
     # fit_gradient currently does not attach mle_settings
     assert_equal(res_g1.method, 'bfgs')
 
 
+def test_glm_irls_scale_dev():
+    nobs, k_vars = 50, 4
+    np.random.seed(987126)
+    x = np.random.randn(nobs, k_vars - 1)
+    exog = add_constant(x, has_constant='add')
+    y = np.exp(0.1 * exog.sum(1)) * np.random.gamma(5, 1 / 5., size=nobs)
+
+    mod = GLM(y, exog, family=sm.families.Gamma(sm.families.links.log()))
+    res = mod.fit(scale='dev')
+    assert_allclose(res.scale, res.deviance / res.df_resid, rtol=1e-10)
+    assert_allclose(res.fit_history['deviance'][-1] * res.scale,
+                    res.deviance, rtol=1e-6)
+
+
+def test_glm_irls_step_halving():
+    rs = np.random.RandomState(0)
+    nobs = 50
+    x = rs.uniform(0, 3, nobs)
+    exog = add_constant(x)
+    endog = np.exp(0.5 + 0.8 * x) * rs.gamma(5, 1 / 5., nobs)
+    family = sm.families.InverseGaussian(sm.families.links.log())
+    res1 = GLM(endog, exog, family=family).fit()
+    # the first full IRLS step from these start_params overflows mu
+    start_params = np.array([-5., 0.3])
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        res2 = GLM(endog, exog, family=family).fit(start_params=start_params)
+        assert res2.converged
+        assert np.all(np.isfinite(res2.fit_history['deviance'][1:]))
+        assert np.isfinite(res2.deviance)
+        assert_allclose(res2.params, res1.params, rtol=1e-6)
+
+        with pytest.raises(ValueError, match="detected in weights"):
+            GLM(endog, exog, family=family).fit(start_params=start_params,
+                                                max_step_halving=0)
+
+        # results of a fit that stops on a halved step use the halved params
+        res4 = GLM(endog, exog, family=family).fit(start_params=start_params,
+                                                   maxiter=1)
+        assert_equal(res4.params, res4.fit_history['params'][-1])
+        assert np.isfinite(res4.deviance)
+        assert np.isfinite(res4.llf)
+        assert np.all(np.isfinite(res4.bse))
+        assert_allclose(res4.mu, res4.model.mu, rtol=1e-13)
+        assert_allclose(res4.deviance,
+                        family.deviance(endog, res4.model.mu), rtol=1e-13)
+
+    # without start_params the first step is never halved
+    res3 = GLM(endog, exog, family=family).fit(max_step_halving=0)
+    assert_allclose(res3.params, res1.params, rtol=1e-13)
+    assert_equal(res3.fit_history['iteration'],
+                 res1.fit_history['iteration'])
+    assert_allclose(res3.fit_history['deviance'],
+                    res1.fit_history['deviance'], rtol=1e-13)
+
+
+def test_deviance_integer_input():
+    family = sm.families.Gaussian()
+    endog = np.array([1, 2, 3])
+    mu = np.array([1, 2, 2])
+    dev = family.deviance(endog, mu, freq_weights=np.array([1., 2, 1]))
+    assert_allclose(dev, 1.)
+    assert_allclose(family.deviance(endog, mu), 1.)
+
+
 class CheckWtdDuplicationMixin(object):
     decimal_params = DECIMAL_4
 
@@ -2402,6 +2474,46 @@ def test_output_exposure_null(reset_randomstate):
     # Check that they are different
     assert np.abs(null_model_without_exposure.llf - model.llnull) > 1
 
+
+@pytest.mark.parametrize("family", [sm.families.Poisson(),
+                                    sm.families.Gamma(),
+                                    sm.families.Binomial()])
+def test_null_weights(family):
+    rs = np.random.RandomState(0)
+    x = add_constant(rs.standard_normal(200))
+    if isinstance(family, sm.families.Binomial):
+        y = rs.binomial(1, 0.4, size=200)
+    else:
+        y = rs.poisson(3, size=200) + 1.
+    freq_weights = rs.randint(1, 4, size=200)
+    var_weights = rs.uniform(0.5, 2, size=200)
+    res = GLM(y, x, family=family, freq_weights=freq_weights,
+              var_weights=var_weights).fit()
+    res_null = GLM(y, x[:, :1], family=family, freq_weights=freq_weights,
+                   var_weights=var_weights).fit()
+    assert_allclose(res.null, res_null.fittedvalues, rtol=1e-8)
+    assert_allclose(res.null_deviance, res_null.deviance, rtol=1e-8)
+
+
+def test_null_binomial_counts():
+    # n_trials enters the weights of the null model with 2-d endog
+    rs = np.random.RandomState(0)
+    x = add_constant(rs.standard_normal(200))
+    n_trials = rs.randint(1, 20, size=200)
+    successes = rs.binomial(n_trials, 0.4)
+    endog = np.column_stack((successes, n_trials - successes))
+    freq_weights = rs.randint(1, 4, size=200)
+    var_weights = rs.uniform(0.5, 2, size=200)
+    family = sm.families.Binomial()
+    res = GLM(endog, x, family=family, freq_weights=freq_weights,
+              var_weights=var_weights).fit()
+    res_null = GLM(endog, x[:, :1], family=family, freq_weights=freq_weights,
+                   var_weights=var_weights).fit()
+    assert_allclose(res.null, res_null.fittedvalues, rtol=1e-8)
+    assert_allclose(res.null_deviance, res_null.deviance, rtol=1e-8)
+    assert_allclose(res.llnull, res_null.llf, rtol=1e-8)
+
+
 def test_qaic():
 
     # Example from documentation of R package MuMIn
@@ -2,7 +2,7 @@ import copy
 from itertools import zip_longest
 import time
 
-from statsmodels.compat.python import lrange, lmap, lzip
+from statsmodels.compat.python import lmap, lzip
 import numpy as np
 from statsmodels.iolib.table import SimpleTable
 from statsmodels.iolib.tableformatting import (gen_fmt, fmt_2,
@@ -27,6 +27,22 @@ def forg(x, prec=3):
                          .format(prec=prec))
 
 
+def _forg_array(x, prec=3):
+    """vectorized version of forg, returns a list of str"""
+    if prec == 3:
+        fmt_g, fmt_f = '%9.3g', '%9.3f'
+    elif prec == 4:
+        fmt_g, fmt_f = '%10.4g', '%10.4f'
+    else:
+        raise ValueError("`prec` argument must be either 3 or 4, not {prec}"
+                         .format(prec=prec))
+    x = np.asarray(x, dtype=float)
+    abs_x = np.abs(x)
+    use_g = (abs_x >= 1e4) | (abs_x < 1e-4)
+    return np.where(use_g, np.char.mod(fmt_g, x),
+                    np.char.mod(fmt_f, x)).tolist()
+
+
 def d_or_f(x, width=6):
     """convert number to string with either integer of float formatting
 
@@ -198,16 +214,17 @@ def summary(self, yname=None, xname=None, title=0, alpha=.05,
     params = self.params
     conf_int = self.conf_int(alpha)
     std_err = self.bse
-    exog_len = lrange(len(xname))
     tstat = tstats[modeltype]
     prob_stat = prob_stats[modeltype]
 
     # Simpletable should be able to handle the formating
-    params_data = lzip(["%#6.4g" % (params[i]) for i in exog_len],
-                       ["%#6.4f" % (std_err[i]) for i in exog_len],
-                       ["%#6.4f" % (tstat[i]) for i in exog_len],
-                       ["%#6.4f" % (prob_stat[i]) for i in exog_len],
-                       ["(%#5g, %#5g)" % tuple(conf_int[i]) for i in exog_len])
+    # bind the formatters once instead of parsing the format in every row
+    fmt_g = "{:#6.4g}".format
+    fmt_f = "{:#6.4f}".format
+    fmt_ci = "({:#5g}, {:#5g})".format
+    params_data = [(fmt_g(p), fmt_f(se), fmt_f(t), fmt_f(pv), fmt_ci(lo, hi))
+                   for p, se, t, pv, (lo, hi)
+                   in zip(params, std_err, tstat, prob_stat, conf_int)]
     parameter_table = SimpleTable(params_data,
                                   param_header[modeltype],
                                   params_stubs,
@@ -228,12 +245,10 @@ def summary(self, yname=None, xname=None, title=0, alpha=.05,
         """
         print summary table for ols models
         """
-        table = str(general_table)+'\n'+str(parameter_table)
-        return table
+        return '\n'.join((str(general_table), str(parameter_table)))
 
     def glm_printer():
-        table = str(general_table)+'\n'+str(parameter_table)
-        return table
+        return '\n'.join((str(general_table), str(parameter_table)))
 
     printers = {'OLS': ols_printer, 'GLM': glm_printer}
 
@@ -441,14 +456,14 @@ def summary_params(results, yname=None, xname=None, alpha=.05, use_t=True,
 
     params_stubs = xname
 
-    exog_idx = lrange(len(xname))
-
-    params_data = lzip([forg(params[i], prec=4) for i in exog_idx],
-                       [forg(std_err[i]) for i in exog_idx],
-                       [forg(tvalues[i]) for i in exog_idx],
-                       ["%#6.3f" % (pvalues[i]) for i in exog_idx],
-                       [forg(conf_int[i,0]) for i in exog_idx],
-                       [forg(conf_int[i,1]) for i in exog_idx])
+    conf_int = np.asarray(conf_int)
+    params_data = lzip(_forg_array(params, prec=4),
+                       _forg_array(std_err),
+                       _forg_array(tvalues),
+                       np.char.mod("%#6.3f",
+                                   np.asarray(pvalues, dtype=float)).tolist(),
+                       _forg_array(conf_int[:, 0]),
+                       _forg_array(conf_int[:, 1]))
     parameter_table = SimpleTable(params_data,
                                   param_header,
                                   params_stubs,
@@ -843,7 +858,7 @@ class Summary(object):
         '''
         txt = summary_return(self.tables, return_fmt='text')
         if self.extra_txt is not None:
-            txt = txt + '\n\n' + self.extra_txt
+            txt = '\n\n'.join((txt, self.extra_txt))
         return txt
 
     def as_latex(self):
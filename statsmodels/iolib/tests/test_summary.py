@@ -7,6 +7,7 @@ import numpy as np  # noqa: F401
 import pytest
 
 from statsmodels.datasets import macrodata
+from statsmodels.iolib.summary import _forg_array, forg
 from statsmodels.regression.linear_model import OLS
 
 
@@ -31,6 +32,16 @@ def test_wrong_len_xname(reset_randomstate):
         res.summary(xname=['x1', 'x2', 'x3'])
 
 
+@pytest.mark.parametrize('prec', [3, 4])
+def test_forg_array(prec):
+    x = np.array([0., 1e-5, -1e-4, 0.5, -12.345678, 9999.9999, 1e4, -3e10,
+                  np.nan, np.inf])
+    expected = [forg(v, prec=prec) for v in x]
+    assert _forg_array(x, prec=prec) == expected
+    with pytest.raises(ValueError):
+        _forg_array(x, prec=2)
+
+
 if __name__ == '__main__':
 
     from statsmodels.regression.tests.test_regression import TestOLS
@@ -1,4 +1,6 @@
 import numpy as np
+from scipy import linalg
+
 from statsmodels.tools.tools import Bunch
 
 
@@ -25,6 +27,10 @@ class _MinimalWLS(object):
     check_weights : bool, optional
         Flag indicating whether to check for inf/nan in weights.
         If True and any are found, ValueError is raised.
+    out : ndarray, optional
+        Array with the same shape as exog that is used to store the weighted
+        exog. This allows memory to be reused when the class is instantiated
+        repeatedly with the same exog, e.g. in IRLS iterations.
 
     Notes
     -----
@@ -38,7 +44,7 @@ class _MinimalWLS(object):
     msg = 'NaN, inf or invalid value detected in {0}, estimation infeasible.'
 
     def __init__(self, endog, exog, weights=1.0, check_endog=False,
-                 check_weights=False):
+                 check_weights=False, out=None):
         self.endog = endog
         self.exog = exog
         self.weights = weights
@@ -54,6 +60,9 @@ class _MinimalWLS(object):
         self.wendog = w_half * endog
         if np.isscalar(weights):
             self.wexog = w_half * exog
+        elif out is not None:
+            self.wexog = np.multiply(np.asarray(w_half)[:, None], exog,
+                                     out=out)
         else:
             self.wexog = np.asarray(w_half)[:, None] * exog
 
@@ -64,12 +73,19 @@ class _MinimalWLS(object):
         Parameters
         ----------
         method : str, optional
-            Method to use to estimate parameters.  "pinv", "qr" or "lstsq"
+            Method to use to estimate parameters.  "pinv", "qr", "lstsq" or
+            "cholesky"
 
               * "pinv" uses the Moore-Penrose pseudoinverse
                  to solve the least squares problem.
               * "qr" uses the QR factorization.
-              * "lstsq" uses the least squares implementation in numpy.linalg
+              * "lstsq" uses the LAPACK least squares solver gelsy, based on a
+                complete orthogonal factorization with column pivoting. The
+                rank is truncated where the condition number estimate of the
+                triangular factor exceeds 1 / (eps * max(nobs, k_vars)), and
+                the minimum norm solution is returned.
+              * "cholesky" solves the normal equations using the Cholesky
+                factorization of the weighted cross-product of exog.
 
         Returns
         -------
@@ -96,10 +112,17 @@ class _MinimalWLS(object):
             params = pinv_wexog.dot(self.wendog)
         elif method == 'qr':
             Q, R = np.linalg.qr(self.wexog)
-            params = np.linalg.solve(R, np.dot(Q.T, self.wendog))
+            params = linalg.solve_triangular(R, np.dot(Q.T, self.wendog))
+        elif method == 'cholesky':
+            xtx = np.dot(self.wexog.T, self.wexog)
+            xty = np.dot(self.wexog.T, self.wendog)
+            params = linalg.cho_solve(linalg.cho_factor(xtx, lower=True), xty)
         else:
-            params, _, _, _ = np.linalg.lstsq(self.wexog, self.wendog,
-                                              rcond=-1)
+            # same default tolerance as numpy.linalg.lstsq, a tolerance of
+            # eps is too small to detect exactly collinear columns
+            cond = np.finfo(np.float64).eps * max(self.wexog.shape)
+            params, _, _, _ = linalg.lstsq(self.wexog, self.wendog, cond=cond,
+                                           lapack_driver='gelsy')
         return self.results(params)
 
     def results(self, params):
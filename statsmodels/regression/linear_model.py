@@ -39,7 +39,7 @@ import warnings
 
 import numpy as np
 from scipy import optimize, stats
-from scipy.linalg import toeplitz
+from scipy.linalg import solve_triangular, toeplitz
 
 import statsmodels.base.model as base
 import statsmodels.base.wrapper as wrap
@@ -48,7 +48,8 @@ from statsmodels.emplike.elregress import _ELRegOpts
 from statsmodels.regression._prediction import PredictionResults
 from statsmodels.tools.decorators import cache_readonly, cache_writable
 from statsmodels.tools.sm_exceptions import InvalidTestWarning
-from statsmodels.tools.tools import pinv_extended
+from statsmodels.tools.tools import (
+    _rank_from_singular_values, pinv_extended)
 from statsmodels.tools.validation import string_like
 
 from . import _prediction as pred
@@ -303,12 +304,13 @@ class RegressionModel(base.LikelihoodModel):
                     hasattr(self, 'rank')):
 
                 self.pinv_wexog, singular_values = pinv_extended(self.wexog)
-                self.normalized_cov_params = np.dot(
-                    self.pinv_wexog, np.transpose(self.pinv_wexog))
+                self.normalized_cov_params = np.dot(self.pinv_wexog,
+                                                    self.pinv_wexog.T)
 
                 # Cache these singular values for use later.
                 self.wexog_singular_values = singular_values
-                self.rank = np.linalg.matrix_rank(np.diag(singular_values))
+                self.rank = _rank_from_singular_values(
+                    singular_values, singular_values.shape[0])
 
             beta = np.dot(self.pinv_wexog, self.wendog)
 
@@ -319,17 +321,19 @@ class RegressionModel(base.LikelihoodModel):
                     hasattr(self, 'rank')):
                 Q, R = np.linalg.qr(self.wexog)
                 self.exog_Q, self.exog_R = Q, R
-                self.normalized_cov_params = np.linalg.inv(np.dot(R.T, R))
+                R_inv = solve_triangular(R, np.eye(R.shape[1]))
+                self.normalized_cov_params = np.dot(R_inv, R_inv.T)
 
                 # Cache singular values from R.
                 self.wexog_singular_values = np.linalg.svd(R, 0, 0)
-                self.rank = np.linalg.matrix_rank(R)
+                self.rank = _rank_from_singular_values(
+                    self.wexog_singular_values, max(R.shape))
             else:
                 Q, R = self.exog_Q, self.exog_R
 
             # used in ANOVA
             self.effects = effects = np.dot(Q.T, self.wendog)
-            beta = np.linalg.solve(R, effects)
+            beta = solve_triangular(R, effects)
         else:
             raise ValueError('method has to be "pinv" or "qr"')
 
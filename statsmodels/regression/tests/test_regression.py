@@ -1405,3 +1405,15 @@ def test_summary_no_constant():
     y = rs.standard_normal(100)
     summary = OLS(y, x).fit().summary()
     assert "R² is computed " in summary.as_text()
+
+
+def test_rank_from_singular_values(reset_randomstate):
+    x = np.random.standard_normal((100, 3))
+    exog = np.column_stack((x, x[:, :2].sum(1)))
+    y = x.sum(1) + np.random.standard_normal(100)
+    res = OLS(y, exog).fit()
+    assert res.model.rank == np.linalg.matrix_rank(exog)
+    assert res.df_resid == 100 - 3
+
+    res_qr = OLS(y, x).fit(method="qr")
+    assert res_qr.model.rank == 3
@@ -43,6 +43,34 @@ class TestMinimalWLS(object):
         assert_allclose(res.params, minres.params)
         assert_allclose(res.resid, minres.resid)
 
+    @pytest.mark.parametrize('method', ['pinv', 'qr', 'lstsq', 'cholesky'])
+    def test_methods(self, method):
+        res = WLS(self.endog1, self.exog1, weights=self.weights1).fit()
+        minres = _MinimalWLS(self.endog1, self.exog1,
+                             weights=self.weights1).fit(method=method)
+        assert_allclose(res.params, minres.params)
+        assert_allclose(res.resid, minres.resid)
+
+    def test_lstsq_rank_deficient(self):
+        # duplicated column, both methods give the minimum norm solution
+        exog = np.column_stack((self.exog1, self.exog1[:, -1]))
+        res = _MinimalWLS(self.endog1, exog,
+                          weights=self.weights1).fit(method='pinv')
+        minres = _MinimalWLS(self.endog1, exog,
+                             weights=self.weights1).fit(method='lstsq')
+        assert_allclose(minres.params, res.params, rtol=1e-8, atol=1e-12)
+        assert_allclose(minres.params[-2], minres.params[-1], rtol=1e-8)
+        assert_allclose(minres.resid, res.resid, rtol=1e-8, atol=1e-12)
+
+    def test_out(self):
+        out = np.empty_like(self.exog1)
+        res = _MinimalWLS(self.endog1, self.exog1,
+                          weights=self.weights1).fit()
+        minres = _MinimalWLS(self.endog1, self.exog1, weights=self.weights1,
+                             out=out)
+        assert minres.wexog is out
+        assert_allclose(minres.fit().params, res.params)
+
     @pytest.mark.parametrize('bad_value', [np.nan, np.inf])
     def test_inf_nan(self, bad_value):
         with pytest.raises(
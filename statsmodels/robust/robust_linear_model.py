@@ -18,6 +18,7 @@ import scipy.stats as stats
 
 from statsmodels.tools.decorators import cache_readonly
 from statsmodels.tools.sm_exceptions import ConvergenceWarning
+from statsmodels.tools.tools import _rank_from_singular_values, pinv_extended
 import statsmodels.regression.linear_model as lm
 import statsmodels.regression._tools as reg_tools
 import statsmodels.robust.norms as norms
@@ -120,12 +121,14 @@ class RLM(base.LikelihoodModel):
 
         Resets the history and number of iterations.
         """
-        self.pinv_wexog = np.linalg.pinv(self.exog)
+        # a single SVD gives both the pseudoinverse and the rank
+        self.pinv_wexog, singular_values = pinv_extended(self.exog)
         self.normalized_cov_params = np.dot(self.pinv_wexog,
-                                            np.transpose(self.pinv_wexog))
-        self.df_resid = (float(self.exog.shape[0] -
-                               np.linalg.matrix_rank(self.exog)))
-        self.df_model = float(np.linalg.matrix_rank(self.exog) - 1)
+                                            self.pinv_wexog.T)
+        rank = _rank_from_singular_values(singular_values,
+                                          max(self.exog.shape))
+        self.df_resid = float(self.exog.shape[0] - rank)
+        self.df_model = float(rank - 1)
         self.nobs = float(self.endog.shape[0])
 
     def score(self, params):
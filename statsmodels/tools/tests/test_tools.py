@@ -145,6 +145,14 @@ class TestTools(object):
         assert_almost_equal(np_inv, sm_inv)
         assert_almost_equal(np_sing_vals, sing_vals)
 
+    def test_rank_from_singular_values(self):
+        X = standard_normal((40, 10))
+        X[:, 5] = X[:, 1] + X[:, 3]
+        _, sing_vals = pinv_extended(X)
+        rank = tools._rank_from_singular_values(sing_vals, max(X.shape))
+        assert_equal(rank, np.linalg.matrix_rank(X))
+        assert_equal(tools._rank_from_singular_values(np.empty(0), 0), 0)
+
     def test_fullrank(self):
         import warnings
         with warnings.catch_warnings():
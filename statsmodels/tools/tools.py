@@ -419,6 +419,20 @@ def pinv_extended(x, rcond=1e-15):
     return res, s_orig
 
 
+def _rank_from_singular_values(singular_values, max_dim):
+    """
+    Returns the matrix rank given the singular values of the matrix.
+    Uses the same default tolerance as numpy.linalg.matrix_rank, where
+    max_dim is the largest dimension of the matrix, but avoids
+    recomputing the SVD.
+    """
+    if singular_values.size == 0:
+        return 0
+    tol = (singular_values.max() * max_dim *
+           np.finfo(singular_values.dtype).eps)
+    return int(np.count_nonzero(singular_values > tol))
+
+
 def recipr(x):
     """
     Reciprocal of an array with entries less than or equal to 0 set to 0.